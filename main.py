@@ -10,7 +10,7 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description='India External Debt Analysis')
     
     parser.add_argument('--steps', nargs='+', default=['all'],
-                        choices=['all', 'preprocessing', 'analysis', 'visualization'],
+                        choices=['all', 'preprocessing', 'analysis', 'rollups', 'visualization'],
                         help='Steps to run in the pipeline')
     
     return parser.parse_args()
@@ -28,8 +28,13 @@ def run_pipeline(steps):
         import scripts.data_analysis
         scripts.data_analysis.main()
     
+    if 'all' in steps or 'rollups' in steps:
+        print("Step 3: Cross-Country Rollups")
+        import scripts.rollups
+        scripts.rollups.main()
+    
     if 'all' in steps or 'visualization' in steps:
-        print("Step 3: Data Visualization")
+        print("Step 4: Data Visualization")
         import scripts.visualization
         scripts.visualization.main()
     
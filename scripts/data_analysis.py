@@ -107,33 +107,25 @@ def debt_composition_analysis(df, long_df):
     else:
         years = [int(col) for col in df.columns[1:] if col.isdigit()]
 
-    debt_by_type = pd.DataFrame(index=years)
-    debt_by_debtor = pd.DataFrame(index=years)
-    debt_flows = pd.DataFrame(index=years)
-
-    for i, year in enumerate(years):
-        total_debt_value = df['Total External debt stocks'].iloc[i]
-        debt_by_type.at[year, 'Total External debt stocks'] = total_debt_value
-
-        short_term_ratio = df['short_term_ratio'].iloc[i]
-        short_term_debt = (short_term_ratio * total_debt_value) / 100
-        debt_by_type.at[year, 'Short-term external debt'] = short_term_debt
-        debt_by_type.at[year, 'Short-term external debt (%)'] = short_term_ratio
-
-        public_debt_ratio = df['public_debt_ratio'].iloc[i]
-        public_debt = (public_debt_ratio * total_debt_value) / 100
-        debt_by_type.at[year, 'Public sector'] = public_debt
-        debt_by_type.at[year, 'Public sector (%)'] = public_debt_ratio
-
-        debt_flows.at[year, 'Debt Service'] = df['debt_service'].iloc[i]
-        debt_flows.at[year, 'Debt Service Ratio (%)'] = df['debt_service_ratio'].iloc[i]
-
-        debt_by_debtor.at[year, 'Public sector'] = public_debt
-        debt_by_debtor.at[year, 'Public sector (%)'] = public_debt_ratio
-
-        private_sector = total_debt_value - public_debt
-        debt_by_debtor.at[year, 'Private sector not guaranteed'] = private_sector
-        debt_by_debtor.at[year, 'Private sector not guaranteed (%)'] = 100 - public_debt_ratio
+    debt_by_type = pd.DataFrame({
+        'Total External debt stocks': df['Total External debt stocks'].to_numpy(dtype=float),
+        'Short-term external debt': df['short_term_debt'].to_numpy(dtype=float),
+        'Short-term external debt (%)': df['short_term_ratio'].to_numpy(dtype=float),
+        'Public sector': df['public_sector'].to_numpy(dtype=float),
+        'Public sector (%)': df['public_debt_ratio'].to_numpy(dtype=float)
+    }, index=years)
+
+    debt_by_debtor = pd.DataFrame({
+        'Public sector': df['public_sector'].to_numpy(dtype=float),
+        'Public sector (%)': df['public_debt_ratio'].to_numpy(dtype=float),
+        'Private sector not guaranteed': df['private_debt'].to_numpy(dtype=float),
+        'Private sector not guaranteed (%)': df['private_debt_ratio'].to_numpy(dtype=float)
+    }, index=years)
+
+    debt_flows = pd.DataFrame({
+        'Debt Service': df['debt_service'].to_numpy(dtype=float),
+        'Debt Service Ratio (%)': df['debt_service_ratio'].to_numpy(dtype=float)
+    }, index=years)
 
     debt_by_type.reset_index(names='Year').to_csv("results/tables/debt_by_type.csv", index=False)
     debt_by_debtor.reset_index(names='Year').to_csv("results/tables/debt_by_debtor.csv", index=False)
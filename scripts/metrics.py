@@ -0,0 +1,137 @@
+import ast
+import numpy as np
+
+INDICATORS = {
+    "principal_repayments": "Principal repayments (long-term)",
+    "interest_payments": "Interest payments (long-term)",
+    "total_debt": "Total External debt stocks",
+    "short_term_debt": "Short-term external debt",
+    "public_sector": "Public sector"
+}
+
+DERIVED_METRICS = {
+    "debt_service": "principal_repayments + interest_payments",
+    "debt_service_ratio": "debt_service / total_debt * 100",
+    "short_term_ratio": "short_term_debt / total_debt * 100",
+    "public_debt_ratio": "public_sector / total_debt * 100",
+    "private_debt": "total_debt - public_sector",
+    "private_debt_ratio": "private_debt / total_debt * 100"
+}
+
+_BINARY_OPS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply
+}
+
+def safe_divide(numerator, denominator):
+    numerator, denominator = np.broadcast_arrays(
+        np.asarray(numerator, dtype=float), np.asarray(denominator, dtype=float))
+    # Non-positive denominators give 0 as before; missing denominators stay missing
+    result = np.zeros(numerator.shape)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    result[np.isnan(denominator)] = np.nan
+    return result
+
+def parse_expression(expression):
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid metric expression '{expression}': {e}")
+
+    for node in ast.walk(tree.body):
+        if isinstance(node, ast.BinOp):
+            if not isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div)):
+                raise ValueError(f"Unsupported operator in '{expression}'")
+        elif isinstance(node, ast.UnaryOp):
+            if not isinstance(node.op, (ast.USub, ast.UAdd)):
+                raise ValueError(f"Unsupported operator in '{expression}'")
+        elif isinstance(node, ast.Constant):
+            if not isinstance(node.value, (int, float)) or isinstance(node.value, bool):
+                raise ValueError(f"Unsupported constant in '{expression}'")
+        elif not isinstance(node, (ast.Name, ast.Load, ast.operator, ast.unaryop)):
+            raise ValueError(f"Unsupported syntax in '{expression}'")
+
+    return tree.body
+
+def expression_dependencies(node):
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+def compile_metrics(definitions):
+    parsed = {}
+    for name, expression in definitions.items():
+        if not name.isidentifier():
+            raise ValueError(f"Invalid metric name '{name}'")
+        parsed[name] = parse_expression(expression)
+
+    # Depth-first topological sort so every metric runs after the metrics it references
+    plan = []
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            cycle = " -> ".join(path + [name])
+            raise ValueError(f"Circular metric definition: {cycle}")
+        state[name] = "visiting"
+        for dependency in sorted(expression_dependencies(parsed[name])):
+            if dependency in parsed and dependency != name:
+                visit(dependency, path + [name])
+            elif dependency == name:
+                raise ValueError(f"Circular metric definition: {name} -> {name}")
+        state[name] = "done"
+        plan.append((name, parsed[name]))
+
+    for name in parsed:
+        visit(name, [])
+
+    return plan
+
+def required_inputs(plan):
+    defined = {name for name, _ in plan}
+    inputs = set()
+    for _, node in plan:
+        inputs |= expression_dependencies(node) - defined
+    return inputs
+
+def evaluate_metrics(plan, inputs):
+    values = {name: np.asarray(array, dtype=float) for name, array in inputs.items()}
+    missing = required_inputs(plan) - set(values)
+    if missing:
+        raise ValueError(f"Missing inputs for metrics: {sorted(missing)}")
+    overlap = {name for name, _ in plan} & set(values)
+    if overlap:
+        raise ValueError(f"Metrics shadow existing inputs: {sorted(overlap)}")
+    shape = np.broadcast_shapes(*(array.shape for array in values.values()))
+
+    # Subexpressions are keyed by their normalised AST, so repeated terms are computed once
+    cache = {}
+
+    def evaluate(node):
+        if isinstance(node, ast.Name):
+            return values[node.id]
+        if isinstance(node, ast.Constant):
+            return float(node.value)
+
+        key = ast.dump(node)
+        if key in cache:
+            return cache[key]
+
+        if isinstance(node, ast.UnaryOp):
+            operand = evaluate(node.operand)
+            result = np.negative(operand) if isinstance(node.op, ast.USub) else operand
+        elif isinstance(node.op, ast.Div):
+            result = safe_divide(evaluate(node.left), evaluate(node.right))
+        else:
+            result = _BINARY_OPS[type(node.op)](evaluate(node.left), evaluate(node.right))
+
+        cache[key] = result
+        return result
+
+    results = {}
+    for name, node in plan:
+        values[name] = np.broadcast_to(evaluate(node), shape).astype(float)
+        results[name] = values[name]
+
+    return results
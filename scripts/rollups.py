@@ -0,0 +1,133 @@
+import os
+import pandas as pd
+from scripts.utils import COUNTRIES, create_long_format, load_country_outputs, save_dataframe
+
+COUNTRY_GROUPS = {
+    "region": {
+        "India": "South Asia"
+    },
+    "income_group": {
+        "India": "Lower middle income"
+    }
+}
+
+ROLLUP_STATISTICS = ["sum", "mean", "median", "min", "max", "count"]
+ROLLUP_INDEX = ['Group', 'Indicator', 'Year']
+
+def _country_long_format(country, processed_df):
+    long_format = create_long_format(processed_df).reset_index(drop=True)
+    long_format['Year'] = long_format['Year'].astype(int)
+    long_format['Value'] = pd.to_numeric(long_format['Value'], errors='coerce')
+    long_format.insert(0, 'Country', country)
+    return long_format
+
+def _aggregate(long_format, mapping):
+    grouped = long_format.assign(Group=long_format['Country'].map(mapping)).dropna(subset=['Group'])
+    rollup = grouped.groupby(ROLLUP_INDEX)['Value'].agg(ROLLUP_STATISTICS)
+    # A cell with no reported values has no total, not a total of 0
+    rollup['sum'] = rollup['sum'].where(rollup['count'] > 0)
+    return rollup.sort_index()
+
+def _empty_rollup():
+    index = pd.MultiIndex.from_arrays([[], [], []], names=ROLLUP_INDEX)
+    return pd.DataFrame(columns=ROLLUP_STATISTICS, index=index, dtype=float)
+
+def build_rollups(country_data, groupings=COUNTRY_GROUPS):
+    store = {
+        'groupings': groupings,
+        'members': {},
+        'rollups': {}
+    }
+
+    for country, processed_df in country_data.items():
+        store['members'][country] = _country_long_format(country, processed_df)
+
+    panel = pd.concat(store['members'].values(), ignore_index=True) if store['members'] else None
+    for grouping, mapping in groupings.items():
+        if panel is None:
+            store['rollups'][grouping] = _empty_rollup()
+        else:
+            store['rollups'][grouping] = _aggregate(panel, mapping)
+
+    return store
+
+def update_country(store, country, processed_df):
+    store['members'][country] = _country_long_format(country, processed_df)
+
+    # Only the groups this country belongs to are recomputed, from their own members
+    for grouping, mapping in store['groupings'].items():
+        group = mapping.get(country)
+        if group is None:
+            continue
+
+        members = [store['members'][c] for c, g in mapping.items() if g == group and c in store['members']]
+        group_rollup = _aggregate(pd.concat(members, ignore_index=True), mapping)
+
+        rollup = store['rollups'][grouping]
+        if rollup.empty:
+            store['rollups'][grouping] = group_rollup
+        else:
+            rollup = rollup.drop(index=group, level='Group', errors='ignore')
+            store['rollups'][grouping] = pd.concat([rollup, group_rollup]).sort_index()
+
+    return store
+
+def query_rollup(store, grouping, group, indicator, statistic="sum"):
+    if grouping not in store['rollups']:
+        raise ValueError(f"Unknown grouping '{grouping}'")
+    if statistic not in ROLLUP_STATISTICS:
+        raise ValueError(f"Unknown statistic '{statistic}', expected one of {ROLLUP_STATISTICS}")
+
+    rollup = store['rollups'][grouping]
+    try:
+        result = rollup.loc[(group, indicator), statistic]
+    except KeyError:
+        raise ValueError(f"No rollup for {grouping}='{group}' and indicator '{indicator}'")
+
+    result.name = f"{indicator} ({statistic})"
+    return result
+
+def save_rollups(store, directory="results/tables"):
+    for grouping, rollup in store['rollups'].items():
+        save_dataframe(rollup.reset_index(), os.path.join(directory, f"rollups_{grouping}.csv"))
+
+    # Groupings and members are stored too, so a later update only touches the changed country
+    groups = pd.DataFrame([
+        {'Grouping': grouping, 'Country': country, 'Group': group}
+        for grouping, mapping in store['groupings'].items()
+        for country, group in mapping.items()
+    ], columns=['Grouping', 'Country', 'Group'])
+    save_dataframe(groups, os.path.join(directory, "rollup_groups.csv"))
+
+    members = list(store['members'].values())
+    members = pd.concat(members, ignore_index=True) if members else pd.DataFrame(
+        columns=['Country', 'Year', 'Indicator', 'Value'])
+    save_dataframe(members, os.path.join(directory, "rollup_members.csv"))
+
+def load_rollups(directory="results/tables"):
+    groups = pd.read_csv(os.path.join(directory, "rollup_groups.csv"))
+    groupings = {}
+    for grouping, rows in groups.groupby('Grouping', sort=False):
+        groupings[grouping] = dict(zip(rows['Country'], rows['Group']))
+
+    members = pd.read_csv(os.path.join(directory, "rollup_members.csv"))
+    store = {
+        'groupings': groupings,
+        'members': {country: rows.reset_index(drop=True) for country, rows in members.groupby('Country')},
+        'rollups': {}
+    }
+
+    for grouping in groupings:
+        rollup = pd.read_csv(os.path.join(directory, f"rollups_{grouping}.csv"))
+        store['rollups'][grouping] = rollup.set_index(ROLLUP_INDEX).sort_index() if not rollup.empty else _empty_rollup()
+
+    return store
+
+def main():
+    country_data = load_country_outputs(COUNTRIES)
+    store = build_rollups(country_data)
+    save_rollups(store)
+    print("Rollups created successfully")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ import os
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+COUNTRIES = ["India"]
+
 def ensure_directory(directory):
     os.makedirs(directory, exist_ok=True)
 
@@ -30,13 +32,22 @@ def load_data(file_path, encodings=["latin1", "cp1252", "ISO-8859-1"]):
     
     raise ValueError(f"Failed to load {file_path} with any of the provided encodings")
 
-def extract_value(df_filtered, year):
-    if not df_filtered.empty and year in df_filtered.columns:
-        value = df_filtered[year].iloc[0]
-        if isinstance(value, str):
-            return float(value.replace(',', ''))
-        return float(value)
-    return 0
+def extract_series(df_filtered, years):
+    if df_filtered.empty:
+        return np.full(len(years), np.nan)
+    row = df_filtered.iloc[0].reindex(years)
+    values = row.astype(str).str.replace(',', '', regex=False)
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+
+def load_country_outputs(countries, directory="data/processed"):
+    country_data = {}
+    for country in countries:
+        file_path = os.path.join(directory, f"{country.lower()}_debt_processed.csv")
+        try:
+            country_data[country] = pd.read_csv(file_path)
+        except Exception as e:
+            print(f"Error loading processed data for {country}: {e}")
+    return country_data
 
 def save_dataframe(df, path, index=False):
     ensure_directory(os.path.dirname(path))
@@ -2,11 +2,12 @@ import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from scripts.utils import ensure_directory
+from scripts.utils import COUNTRIES, ensure_directory, load_country_outputs
 import warnings
 
 def load_processed_data():
@@ -309,6 +310,111 @@ def create_correlation_matrix(processed_df, results):
     else:
         print("Warning: Not enough data for correlation matrix")
 
+def create_small_multiples(panel, indicator, output_path, ncols=10, countries_per_page=None,
+                           title=None, dpi=300):
+    ensure_directory(os.path.dirname(output_path))
+
+    countries = sorted(panel)
+    if not countries:
+        print(f"Warning: No country data available for {indicator} small multiples")
+        return []
+
+    # One countries x years matrix for the whole panel, so every cell shares the same axes
+    matrix = pd.DataFrame({
+        country: pd.Series(pd.to_numeric(df[indicator], errors='coerce').to_numpy(),
+                           index=df['Year'].astype(int))
+        for country, df in panel.items() if indicator in df.columns and 'Year' in df.columns
+    }).sort_index().T.reindex(countries)
+
+    years = matrix.columns.to_numpy(dtype=float)
+    values = matrix.to_numpy(dtype=float)
+    if len(years) == 0 or np.isnan(values).all():
+        print(f"Warning: No {indicator} data available for small multiples")
+        return []
+
+    x_min, x_max = years.min(), years.max()
+    data_min, data_max = np.nanmin(values), np.nanmax(values)
+    y_pad = (data_max - data_min) * 0.05 or 1.0
+    y_min, y_max = data_min - y_pad, data_max + y_pad
+    x_unit = (years - x_min) / ((x_max - x_min) or 1.0)
+    y_unit = (values - y_min) / (y_max - y_min)
+
+    page_size = countries_per_page or len(countries)
+    pages = [range(start, min(start + page_size, len(countries)))
+             for start in range(0, len(countries), page_size)]
+    stem, extension = os.path.splitext(output_path)
+    saved_paths = []
+
+    for page_number, page in enumerate(pages, start=1):
+        page_ncols = min(ncols, len(page))
+        nrows = int(np.ceil(len(page) / page_ncols))
+        cells = np.arange(len(page))
+        cell_x = (cells % page_ncols).astype(float)
+        cell_y = (nrows - 1 - cells // page_ncols).astype(float)
+
+        # Each cell keeps a margin for the country label; lines are placed in grid coordinates
+        left, right, bottom, top = 0.08, 0.04, 0.1, 0.22
+        segments = np.stack([
+            cell_x[:, None] + left + x_unit[None, :] * (1 - left - right),
+            cell_y[:, None] + bottom + y_unit[page.start:page.stop] * (1 - bottom - top)
+        ], axis=-1)
+
+        frames = np.stack([
+            np.column_stack([cell_x + left, cell_y + bottom]),
+            np.column_stack([cell_x + 1 - right, cell_y + bottom]),
+            np.column_stack([cell_x + 1 - right, cell_y + 1 - top]),
+            np.column_stack([cell_x + left, cell_y + 1 - top]),
+            np.column_stack([cell_x + left, cell_y + bottom])
+        ], axis=1)
+
+        page_title = title or indicator
+        if len(pages) > 1:
+            page_title = f"{page_title} (page {page_number} of {len(pages)})"
+        y_labels = [f"{value:,.1f}" for value in (data_min, data_max)]
+
+        # Margins are sized in inches from the label and title lengths so neither is clipped
+        grid_width, grid_height = 1.8 * page_ncols, 1.4 * nrows
+        margin_left = 0.15 + 0.06 * max(len(label) for label in y_labels)
+        margin_right, margin_top, margin_bottom = 0.1, 0.5, 0.1
+        fig_width = max(margin_left + grid_width + margin_right, 0.12 * len(page_title) + 0.4)
+        fig_height = margin_top + grid_height + margin_bottom
+        grid_left = margin_left + (fig_width - margin_left - grid_width - margin_right) / 2
+
+        fig = plt.figure(figsize=(fig_width, fig_height))
+        ax = fig.add_axes([grid_left / fig_width, margin_bottom / fig_height,
+                           grid_width / fig_width, grid_height / fig_height])
+        ax.add_collection(LineCollection(frames, colors='0.7', linewidths=0.6))
+        ax.add_collection(LineCollection(segments, colors='tab:blue', linewidths=1.2))
+
+        for cell, country in zip(cells, countries[page.start:page.stop]):
+            ax.text(cell_x[cell] + left, cell_y[cell] + 1 - top + 0.03, country,
+                    fontsize=8, va='bottom')
+
+        # The shared y labels mark the real data range, not the padded limits
+        label_offsets = bottom + (np.array([data_min, data_max]) - y_min) / (y_max - y_min) * (1 - bottom - top)
+        for row in range(nrows):
+            for label, label_offset in zip(y_labels, label_offsets):
+                ax.text(left - 0.01, nrows - 1 - row + label_offset, label,
+                        fontsize=6, ha='right', va='center')
+
+        # Year labels go under the lowest filled cell of each column, which may sit above a short last row
+        for col in range(page_ncols):
+            lowest = cell_y[cells % page_ncols == col].min()
+            ax.text(col + left, lowest + bottom - 0.02, f"{x_min:.0f}", fontsize=6, va='top')
+            ax.text(col + 1 - right, lowest + bottom - 0.02, f"{x_max:.0f}", fontsize=6, ha='right', va='top')
+
+        ax.set_xlim(0, page_ncols)
+        ax.set_ylim(0, nrows)
+        ax.axis('off')
+        fig.suptitle(page_title, y=1 - 0.25 / fig_height, va='center')
+
+        page_path = f"{stem}_page{page_number}{extension}" if len(pages) > 1 else output_path
+        fig.savefig(page_path, dpi=dpi)
+        plt.close(fig)
+        saved_paths.append(page_path)
+
+    return saved_paths
+
 def main():
     processed_df, long_df = load_processed_data()
     analysis_results = load_analysis_results()
@@ -317,6 +423,10 @@ def main():
     create_flow_visualizations(processed_df, analysis_results)
     create_ratio_visualizations(analysis_results)
     create_correlation_matrix(processed_df, analysis_results)
+
+    panel = load_country_outputs(COUNTRIES)
+    create_small_multiples(panel, 'debt_service_ratio', 'results/figures/debt_service_ratio_panel.png',
+                           title='Debt Service Ratio (%) by Country')
     
     print("Visualizations created successfully")
 